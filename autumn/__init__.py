@@ -25,31 +25,33 @@ def run(
     output: Optional[str] = None,
     extensions: Optional[List[str]] = None,
     split: bool = False,
+    poll_interval: Optional[float] = None,
 ) -> None:
     """
     Convenience function to run Autumn with the specified configuration.
-    
+
     Args:
         path: Directory to watch for changes
         output: Output markdown file path
         extensions: List of file extensions to watch
         split: Whether to split output into separate files by extension
+        poll_interval: Force polling at this interval in seconds instead of
+            native filesystem notifications
     """
     autumn = Autumn(
         watch_path=path,
         output_file=output or "CODE_DOCUMENTATION.md",
         extensions=extensions,
-        split_by_extension=split
+        split_by_extension=split,
+        poll_interval=poll_interval,
     )
-    
+
     # Create initial documentation
     autumn.update_documentation()
-    
+
     # Set up file watching
-    from watchdog.observers import Observer
-    
     event_handler = AutumnEventHandler(autumn)
-    observer = Observer()
+    observer = autumn.observer
     observer.schedule(event_handler, str(autumn.watch_path), recursive=True)
     observer.start()
     
@@ -1,14 +1,27 @@
 import sys
 import argparse
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
 if sys.version_info < (3, 11):
     raise RuntimeError("This script requires Python 3.11 or higher")
 
+import os
 from pathlib import Path
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
+import threading
 import time
 import yaml
+
+try:
+    # libyaml bindings are ~10x faster; fall back to the pure-Python
+    # implementation when PyYAML was built without them.
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 from datetime import datetime
 import pathspec
 from typing import Set, List, Optional
@@ -43,6 +56,13 @@ def parse_args() -> argparse.Namespace:
         "--project", action="store_true", help="Create a project configuration file"
     )
 
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        help="Force polling for changes at this interval in seconds "
+        "(default: use native filesystem notifications)",
+    )
+
     parser.add_argument("--version", action="version", version="%(prog)s 0.1.0")
 
     parser.add_argument(
@@ -67,14 +87,35 @@ class Autumn:
     control which code is included in the context file.
     """
 
+    # Directory names that never contain processable files; the walk skips
+    # them by name without consulting pathspec at all.
+    DEFAULT_SKIP_DIRNAMES = frozenset(
+        {
+            ".git",
+            ".hg",
+            ".svn",
+            ".autumn",
+            "__pycache__",
+            "node_modules",
+            "venv",
+            "target",
+            "dist",
+            "build",
+        }
+    )
+
     def __init__(
         self,
         watch_path: str = ".",
         output_file: str = "CONTEXT.md",
         extensions: Optional[List[str]] = None,
         split_by_extension: bool = False,
+        poll_interval: Optional[float] = None,
     ):
         self.watch_path = Path(watch_path).resolve()
+        # Relative paths are derived by slicing this prefix off absolute path
+        # strings; Path.relative_to is too expensive for the per-file hot path.
+        self._watch_prefix = str(self.watch_path) + os.sep
         self.output_file = Path(output_file)
         self.split_by_extension = split_by_extension
         # Create parent directories if they don't exist
@@ -96,11 +137,56 @@ class Autumn:
             ".php",
             ".sql",
         ]
+        # Frozen set for O(1) suffix checks on the per-file hot path
+        self.extensions_set = frozenset(self.extensions)
+        # mtimes of the ignore sources at last compile; lets reloads skip
+        # re-reading and recompiling patterns that haven't changed
+        self._ignore_mtimes: Optional[tuple] = None
         self.ignore_spec = self._load_ignore_patterns()
-        self.observer = Observer()
+        # The default Observer picks the native backend (inotify on Linux);
+        # an explicit poll_interval forces polling, useful for filesystems
+        # without native change notification (e.g. some network mounts).
+        if poll_interval is not None:
+            self.observer = PollingObserver(timeout=poll_interval)
+        else:
+            self.observer = Observer()
+        # Per-file cache of parsed content so single-file events don't force
+        # a re-read of the whole tree. Keyed by absolute path. The observer
+        # thread mutates it while the debounce timer thread renders, so all
+        # access goes through _cache_lock.
+        self._file_cache: dict[Path, dict] = {}
+        self._cache_lock = threading.Lock()
+        # Serializes renders: debounce timers only guarantee one pending
+        # rebuild, not one running one, and concurrent renders would race on
+        # the same tmp output files
+        self._render_lock = threading.Lock()
+        # Digest of each output file's last-written body, used to skip
+        # rewriting outputs whose content hasn't changed.
+        self._output_digests: dict[Path, bytes] = {}
+
+    def _ignore_source_mtimes(self) -> tuple:
+        """Return the current mtimes of the ignore pattern source files."""
+        mtimes = []
+        for name in (".gitignore", ".docignore"):
+            try:
+                mtimes.append((self.watch_path / name).stat().st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
 
     def _load_ignore_patterns(self) -> pathspec.PathSpec:
+        # Recompile only when .gitignore/.docignore actually changed
+        mtimes = self._ignore_source_mtimes()
+        if mtimes == self._ignore_mtimes:
+            return self.ignore_spec
+        self._ignore_mtimes = mtimes
+
+        # Any previously memoized directory decisions are stale once the
+        # patterns change.
+        self._dir_ignore_cache: dict[str, bool] = {}
+
         patterns = []
+        skip_dirnames = set(self.DEFAULT_SKIP_DIRNAMES)
 
         # Load .gitignore patterns
         gitignore = self.watch_path / ".gitignore"
@@ -126,121 +212,420 @@ class Autumn:
             ]
         )
 
+        # Plain "name/" patterns exclude a directory everywhere it appears;
+        # promote them to the by-name skip set so the walk never descends
+        for pattern in patterns:
+            pattern = pattern.strip()
+            if (
+                pattern.endswith("/")
+                and "/" not in pattern[:-1]
+                and not any(ch in pattern for ch in "!*?[")
+            ):
+                skip_dirnames.add(pattern[:-1])
+        self._skip_dirnames = frozenset(skip_dirnames)
+
         return pathspec.PathSpec.from_lines("gitwildmatch", patterns)
 
-    def _should_process_file(self, file_path: Path) -> bool:
-        if not file_path.is_file():
+    def _is_ignored_dir(self, rel_dir: str) -> bool:
+        """Check whether a directory is entirely excluded by the ignore patterns.
+
+        Results are memoized per directory so the walk pays the pathspec cost
+        once per subtree rather than once per contained file.
+        """
+        cached = self._dir_ignore_cache.get(rel_dir)
+        if cached is None:
+            # The trailing slash lets directory patterns like "node_modules/"
+            # match.
+            cached = self.ignore_spec.match_file(rel_dir + "/")
+            self._dir_ignore_cache[rel_dir] = cached
+        return cached
+
+    def _iter_files(self, dir_path: Optional[Path] = None):
+        """Yield candidate files below dir_path, pruning ignored directories.
+
+        Ignored directories (e.g. node_modules/, venv/) are skipped without
+        descending into them, so their contents are never stat'd or matched.
+        """
+        if dir_path is None:
+            dir_path = self.watch_path
+
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            return
+
+        with entries:
+            for entry in entries:
+                # DirEntry type checks reuse the readdir result, avoiding a
+                # stat syscall per entry; symlinks are not followed.
+                if entry.is_dir(follow_symlinks=False):
+                    # Cheap by-name skip before any pathspec work
+                    if entry.name in self._skip_dirnames:
+                        continue
+                    rel_dir = entry.path[len(self._watch_prefix) :]
+                    if self._is_ignored_dir(rel_dir):
+                        continue
+                    yield from self._iter_files(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path)
+
+    def _should_process_file(self, file_path: Path, known_file: bool = False) -> bool:
+        # Callers walking via _iter_files already know the path is a regular
+        # file and can skip the extra stat.
+        if not known_file and not file_path.is_file():
+            return False
+
+        # Cheapest rejection first: most files fail on extension, so check it
+        # before allocating a relative path and running pathspec
+        if file_path.suffix not in self.extensions_set:
             return False
 
-        relative_path = str(file_path.relative_to(self.watch_path))
+        relative_path = str(file_path)[len(self._watch_prefix) :]
 
         # Check if file matches ignore patterns
-        if self.ignore_spec.match_file(relative_path):
-            return False
+        return not self.ignore_spec.match_file(relative_path)
 
-        # Check if extension should be processed
-        return file_path.suffix in self.extensions
+    # Frontmatter must close within this many bytes of the start of the file;
+    # bounds the search so multi-MB files without frontmatter aren't scanned.
+    FRONTMATTER_LIMIT = 65536
 
     def _extract_frontmatter(self, content: str) -> tuple[dict, str]:
         """Extract YAML frontmatter from content if it exists."""
-        if content.startswith("---\n"):
-            try:
-                # Find the closing '---'
-                parts = content.split("\n---\n", 2)
-                if len(parts) >= 2:
-                    frontmatter = yaml.safe_load(parts[0].replace("---\n", ""))
-                    content = parts[1]
-                    return frontmatter, content
-            except yaml.YAMLError:
-                pass
-        return {}, content
+        if not content.startswith("---\n"):
+            return {}, content
+
+        # Find the closing '---' near the top of the file
+        end = content.find("\n---\n", 4, self.FRONTMATTER_LIMIT)
+        if end < 0:
+            return {}, content
+
+        try:
+            frontmatter = yaml.load(content[4:end], Loader=SafeLoader)
+        except yaml.YAMLError:
+            return {}, content
+
+        return frontmatter or {}, content[end + 5 :]
+
+    def _make_cache_entry(self, stat: os.stat_result, content: str) -> dict:
+        """Build a cache entry from a stat result and raw file content.
+
+        The frontmatter is serialized back to YAML here, once per file read,
+        so renders never redo the dump.
+        """
+        frontmatter, content = self._extract_frontmatter(content)
+        return {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "content": content,
+            "frontmatter": frontmatter,
+            "frontmatter_yaml": (
+                yaml.dump(frontmatter, default_flow_style=False, Dumper=SafeDumper)
+                if frontmatter
+                else ""
+            ),
+        }
+
+    def _build_cache_entry(self, file_path: Path) -> Optional[dict]:
+        """Stat and read a file, returning its cache entry.
+
+        Returns the existing entry for unchanged files, or None if the file
+        disappeared or cannot be read.
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+
+        cached = self._file_cache.get(file_path)
+        if (
+            cached
+            and cached["mtime_ns"] == stat.st_mtime_ns
+            and cached["size"] == stat.st_size
+        ):
+            return cached
+
+        content = file_path.read_text(encoding="utf-8")
+        return self._make_cache_entry(stat, content)
+
+    def _read_files_uring(self, paths: List[Path]) -> Optional[List[Optional[dict]]]:
+        """Read files via io_uring on Linux, if python-liburing is installed.
+
+        Batches read submissions so many reads are in flight at once, which
+        is markedly faster than sequential reads on NVMe during the cold
+        initial scan. Returns cache entries aligned with paths, or None if
+        io_uring is unavailable so callers can fall back to the thread pool.
+        """
+        if sys.platform != "linux":
+            return None
+        try:
+            import liburing
+        except ImportError:
+            return None
+
+        BATCH = 128
+        try:
+            ring = liburing.io_uring()
+            if liburing.io_uring_queue_init(BATCH, ring, 0) < 0:
+                return None
+        except OSError:
+            return None
+
+        entries: List[Optional[dict]] = [None] * len(paths)
+        try:
+            for batch_start in range(0, len(paths), BATCH):
+                batch = []  # (index, fd, buffer, stat)
+                for index in range(
+                    batch_start, min(batch_start + BATCH, len(paths))
+                ):
+                    file_path = paths[index]
+                    try:
+                        stat = file_path.stat()
+                    except OSError:
+                        continue
+
+                    cached = self._file_cache.get(file_path)
+                    if (
+                        cached
+                        and cached["mtime_ns"] == stat.st_mtime_ns
+                        and cached["size"] == stat.st_size
+                    ):
+                        entries[index] = cached
+                        continue
+
+                    try:
+                        fd = os.open(file_path, os.O_RDONLY)
+                    except OSError:
+                        continue
+
+                    buffer = bytearray(stat.st_size)
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_read(
+                        sqe, fd, buffer, len(buffer), 0
+                    )
+                    sqe.user_data = len(batch)
+                    batch.append((index, fd, buffer, stat))
+
+                if not batch:
+                    continue
+
+                retry = []
+                try:
+                    liburing.io_uring_submit(ring)
+                    cqe = liburing.io_uring_cqe()
+                    for _ in range(len(batch)):
+                        liburing.io_uring_wait_cqe(ring, cqe)
+                        index, _, buffer, stat = batch[cqe.user_data]
+                        if cqe.res == len(buffer):
+                            entries[index] = self._make_cache_entry(
+                                stat, buffer.decode("utf-8")
+                            )
+                        else:
+                            # Short reads (legal for io_uring) must not be
+                            # treated as the whole file, and failed reads
+                            # must not silently drop it; redo both through
+                            # the regular path so errors surface the same
+                            # way as the thread-pool fallback
+                            retry.append(index)
+                        liburing.io_uring_cqe_seen(ring, cqe)
+                finally:
+                    for _, fd, _, _ in batch:
+                        os.close(fd)
+
+                for index in retry:
+                    entries[index] = self._build_cache_entry(paths[index])
+        finally:
+            liburing.io_uring_queue_exit(ring)
+
+        return entries
+
+    def _refresh_file(self, file_path: Path) -> None:
+        """Read a single file into the cache, evicting it if it disappeared."""
+        entry = self._build_cache_entry(file_path)
+        with self._cache_lock:
+            if entry is None:
+                self._file_cache.pop(file_path, None)
+            else:
+                self._file_cache[file_path] = entry
+
+    def _evict_file(self, file_path: Path) -> None:
+        """Drop a file from the cache, e.g. after a delete or rename."""
+        with self._cache_lock:
+            self._file_cache.pop(file_path, None)
+
+    def _scan(self) -> None:
+        """Walk the whole tree and bring the file cache up to date.
+
+        Reads are fanned out to a thread pool; the work is I/O-bound so
+        overlapping the read latency speeds up cold scans considerably.
+        """
+        paths = [
+            file_path
+            for file_path in self._iter_files()
+            if self._should_process_file(file_path, known_file=True)
+        ]
+
+        entries = self._read_files_uring(paths)
+        if entries is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                entries = list(executor.map(self._build_cache_entry, paths))
+
+        # Rebuilding the cache wholesale also evicts files that no longer
+        # exist or are no longer processable.
+        new_cache = {
+            path: entry for path, entry in zip(paths, entries) if entry is not None
+        }
+        with self._cache_lock:
+            self._file_cache = new_cache
 
     def update_documentation(self):
-        # Group files by extension
+        self._scan()
+        self._render()
+
+    def _render(self):
+        # One render (and its tmp-file writes) at a time: the debounce timer
+        # guarantees a single pending rebuild but not a single running one,
+        # and overlapping renders would race on the same tmp output files
+        with self._render_lock:
+            self._render_locked()
+
+    def _render_locked(self):
+        # Snapshot the cache so events landing mid-render can't mutate the
+        # dict out from under the iteration
+        with self._cache_lock:
+            cache_items = list(self._file_cache.items())
+
+        # Group cached files by extension
         files_by_extension = {}
 
-        # Process all files
-        for file_path in sorted(self.watch_path.rglob("*")):
-            if not self._should_process_file(file_path):
-                continue
-
+        for file_path, cached in cache_items:
             ext = file_path.suffix
             if ext not in files_by_extension:
                 files_by_extension[ext] = []
 
-            relative_path = file_path.relative_to(self.watch_path)
-            content = file_path.read_text(encoding="utf-8")
-            frontmatter, content = self._extract_frontmatter(content)
-
             files_by_extension[ext].append(
                 {
-                    "path": str(self.watch_path / relative_path),
-                    "content": content,
-                    "frontmatter": frontmatter,
+                    "path": str(file_path),
+                    "content": cached["content"],
+                    "frontmatter_yaml": cached["frontmatter_yaml"],
                 }
             )
 
+        # Deterministic ordering is only needed within each extension bucket;
+        # sorting per bucket beats one sort over every cached path
+        for files in files_by_extension.values():
+            files.sort(key=lambda file_info: file_info["path"])
+
         # Determine the output directory (for split files)
         output_dir = self.output_file.parent
 
+        # Hoisted out of the emit loops: one timestamp covers every output
+        # written by this render
+        now_iso = datetime.now().isoformat()
+
         # Always create the combined file
-        markdown = [
-            "# Project Source Code Context\n",
-            f"*Last updated: {datetime.now().isoformat()}*\n\n",
-            "*This file is automatically maintained by Autumn.*\n\n",
-        ]
+        header = (
+            "# Project Source Code Context\n"
+            f"*Last updated: {now_iso}*\n\n"
+            "*This file is automatically maintained by Autumn.*\n\n"
+        )
 
+        blocks = []
         for ext in sorted(files_by_extension.keys()):
+            ext_tag = ext[1:]
             for file_info in files_by_extension[ext]:
-                markdown.append(f"## {file_info['path']}\n\n")
-                if file_info["frontmatter"]:
-                    markdown.append("### Metadata\n\n```yaml\n")
-                    markdown.append(
-                        yaml.dump(file_info["frontmatter"], default_flow_style=False)
-                    )
-                    markdown.append("```\n\n")
-
-                markdown.append(f"```{ext[1:]}\n")
-                markdown.append(file_info["content"])
-                markdown.append("\n```\n\n")
+                blocks.append(self._render_file_block(file_info, ext_tag))
 
-        self.output_file.write_text("".join(markdown), encoding="utf-8")
-        print(f"Documentation updated: {self.output_file}")
+        self._write_if_changed(self.output_file, header, blocks)
 
         # If split option is enabled, create additional files by extension
         if self.split_by_extension:
+            # Use the base name of the main output file for split files
+            base_name = self.output_file.stem
             for ext, files in files_by_extension.items():
-                # Use the base name of the main output file for split files
-                base_name = self.output_file.stem
-                output_path = output_dir / f"{base_name}_{ext[1:]}.md"
-                markdown = [
-                    f"# {ext[1:].upper()} Files\n",
-                    f"*Last updated: {datetime.now().isoformat()}*\n\n",
-                    "*This file is automatically maintained by Autumn.*\n\n",
+                ext_tag = ext[1:]
+                output_path = output_dir / f"{base_name}_{ext_tag}.md"
+                header = (
+                    f"# {ext_tag.upper()} Files\n"
+                    f"*Last updated: {now_iso}*\n\n"
+                    "*This file is automatically maintained by Autumn.*\n\n"
+                )
+
+                blocks = [
+                    self._render_file_block(file_info, ext_tag)
+                    for file_info in files
                 ]
+                self._write_if_changed(output_path, header, blocks)
+
+    # Sized for throughput on Unix; Windows I/O favors smaller buffers
+    WRITE_BUFFER_SIZE = 64 * 1024 if os.name == "posix" else 8 * 1024
+
+    def _write_if_changed(
+        self, output_path: Path, header: str, blocks: List[str]
+    ) -> None:
+        """Write an output file atomically, skipping it if content is unchanged.
+
+        Only the body blocks participate in the digest — the header carries
+        the timestamp — so no-op rebuilds leave the file untouched and don't
+        ripple through downstream tools watching the output. Blocks are
+        streamed through a buffered binary file rather than joined into one
+        giant string, keeping peak memory flat on large repos, and the write
+        goes through a temp file and os.replace so readers never see a
+        partial file.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        for chunk in blocks:
+            hasher.update(chunk.encode("utf-8"))
+        digest = hasher.digest()
+        if self._output_digests.get(output_path) == digest:
+            return
 
-                for file_info in files:
-                    markdown.append(f"## {file_info['path']}\n\n")
-                    if file_info["frontmatter"]:
-                        markdown.append("### Metadata\n\n```yaml\n")
-                        markdown.append(
-                            yaml.dump(
-                                file_info["frontmatter"], default_flow_style=False
-                            )
-                        )
-                        markdown.append("```\n\n")
-
-                    markdown.append(f"```{ext[1:]}\n")
-                    markdown.append(file_info["content"])
-                    markdown.append("\n```\n\n")
-
-                output_path.write_text("".join(markdown), encoding="utf-8")
-                print(f"Documentation updated: {output_path}")
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        with open(tmp_path, "wb", buffering=self.WRITE_BUFFER_SIZE) as f:
+            f.write(header.encode("utf-8"))
+            for chunk in blocks:
+                f.write(chunk.encode("utf-8"))
+        os.replace(tmp_path, output_path)
+        self._output_digests[output_path] = digest
+        print(f"Documentation updated: {output_path}")
+
+    def _render_file_block(self, file_info: dict, ext_tag: str) -> str:
+        """Render one file's markdown section, caching the result on file_info.
+
+        With split output enabled the same section appears in both the
+        combined file and a per-extension file; the cache makes sure it is
+        only rendered (and its frontmatter only dumped) once.
+        """
+        rendered = file_info.get("_rendered")
+        if rendered is None:
+            parts = [f"## {file_info['path']}\n\n"]
+            if file_info["frontmatter_yaml"]:
+                parts.append("### Metadata\n\n```yaml\n")
+                parts.append(file_info["frontmatter_yaml"])
+                parts.append("```\n\n")
+
+            parts.append(f"```{ext_tag}\n")
+            parts.append(file_info["content"])
+            parts.append("\n```\n\n")
+
+            rendered = "".join(parts)
+            file_info["_rendered"] = rendered
+        return rendered
 
 
 class AutumnEventHandler(FileSystemEventHandler):
+    # Wait this long after an event before rebuilding, so that bursts of
+    # events (editor save-storms, branch switches) coalesce into one rebuild.
+    DEBOUNCE_DELAY = 0.05
+    # Never delay a rebuild longer than this from the first event in a burst.
+    MAX_DELAY = 0.5
+
     def __init__(self, autumn: Autumn):
         self.autumn = autumn
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._burst_start: Optional[float] = None
+        self._full_rescan = False
 
     def on_any_event(self, event):
         # Get the file path
@@ -250,17 +635,73 @@ class AutumnEventHandler(FileSystemEventHandler):
         if event.is_directory or file_path.name == self.autumn.output_file.name:
             return
 
+        # If an ignore file changed, reload ignore patterns and update all.
+        # Renames count too: atomic saves arrive as a move whose dest_path
+        # is the ignore file.
+        if file_path.name in (".docignore", ".gitignore") or (
+            event.event_type == "moved"
+            and Path(event.dest_path).name in (".docignore", ".gitignore")
+        ):
+            self.autumn.ignore_spec = self.autumn._load_ignore_patterns()
+            with self._lock:
+                self._full_rescan = True
+        elif event.event_type == "deleted":
+            # Deleted files fail the is_file() check, so only filter on extension
+            if file_path.suffix not in self.autumn.extensions_set:
+                return
+            self.autumn._evict_file(file_path)
+        elif event.event_type == "moved":
+            # A rename (including editors' write-tmp-then-rename atomic saves)
+            # leaves src_path gone: evict it and ingest the destination
+            dest_path = Path(event.dest_path)
+            src_relevant = file_path.suffix in self.autumn.extensions_set
+            if src_relevant:
+                self.autumn._evict_file(file_path)
+            if self.autumn._should_process_file(dest_path):
+                self.autumn._refresh_file(dest_path)
+            elif not src_relevant:
+                return
+        elif not self.autumn._should_process_file(file_path):
+            # Files that would never appear in the output don't trigger rebuilds
+            return
+        else:
+            # Refresh just the changed file; the debounced rebuild only renders
+            self.autumn._refresh_file(file_path)
+
         # Print the triggering file and event type
         event_type = event.event_type.capitalize()
         relative_path = file_path.relative_to(self.autumn.watch_path)
         print(f"\n🍂 {event_type} detected: {relative_path}")
 
-        # If .docignore changed, reload ignore patterns and update all
-        if file_path.name == ".docignore":
-            self.autumn.ignore_spec = self.autumn._load_ignore_patterns()
-
-        # Update documentation for any file event
-        self.autumn.update_documentation()
+        self._schedule_update()
+
+    def _schedule_update(self):
+        """Schedule a debounced documentation rebuild."""
+        with self._lock:
+            now = time.monotonic()
+            if self._timer is None:
+                self._burst_start = now
+            else:
+                # Coalesce with the pending rebuild; let it fire as scheduled
+                # once we've been deferring for MAX_DELAY.
+                if now - self._burst_start >= self.MAX_DELAY - self.DEBOUNCE_DELAY:
+                    return
+                self._timer.cancel()
+
+            self._timer = threading.Timer(self.DEBOUNCE_DELAY, self._run_update)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _run_update(self):
+        with self._lock:
+            self._timer = None
+            self._burst_start = None
+            full_rescan = self._full_rescan
+            self._full_rescan = False
+        if full_rescan:
+            self.autumn.update_documentation()
+        else:
+            self.autumn._render()
 
 
 def main():
@@ -318,6 +759,7 @@ def main():
         output_file=output_file,
         extensions=extensions,
         split_by_extension=args.split,
+        poll_interval=args.poll_interval,
     )
 
     # Create initial documentation
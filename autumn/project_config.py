@@ -1,5 +1,12 @@
 from pathlib import Path
 import yaml
+
+try:
+    # Prefer the libyaml C bindings when PyYAML was built against them
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
@@ -85,13 +92,15 @@ class ProjectConfig:
         )
 
         with open(config_dir / cls.CONFIG_FILE, "w") as f:
-            yaml.dump(config.to_dict(path), f, default_flow_style=False)
+            yaml.dump(
+                config.to_dict(path), f, default_flow_style=False, Dumper=SafeDumper
+            )
 
     @classmethod
     def load_config(cls, config_path: Path) -> AutumnConfig:
         """Load project configuration."""
         with open(config_path, "r") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
 
         return AutumnConfig.from_dict(data, config_path.parent.parent)
 